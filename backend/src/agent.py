@@ -83,6 +83,10 @@ async def entrypoint(ctx: JobContext):
         # See more at https://docs.livekit.io/agents/build/turns
         turn_detection=MultilingualModel(),
         vad=ctx.proc.userdata["vad"],
+        # end the user's turn shortly after the turn detector is confident, and never wait more than 3s
+        # See more at https://docs.livekit.io/agents/build/turns/#endpointing-delay
+        min_endpointing_delay=0.1,
+        max_endpointing_delay=3.0,
         # allow the LLM to generate a response while waiting for the end of turn
         # See more at https://docs.livekit.io/agents/build/audio/#preemptive-generation
         preemptive_generation=True,